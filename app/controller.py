@@ -1,15 +1,40 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set, Tuple
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlalchemy import text
-from datetime import datetime, timedelta
+from sqlalchemy import text, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from datetime import date, datetime, time, timedelta
 from jobspy import scrape_jobs
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import asyncio
+import functools
 import requests
-import math
+import logging
+import hashlib
+import json
+import orjson
+from redis.exceptions import RedisError
 from db.schema import Job
+from db.cache import redis_client
+from app.pagination import encode_cursor, decode_cursor, after_cursor
+from config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
 
 max_results_wanted = 10
+# Upper bound on results_wanted, so a page (and the rows held for it) stays small
+max_page_size = 100
+
+# Columns returned by job listings; large text columns like description are left out
+_LISTING_COLUMNS = (
+    Job.id, Job.job_id, Job.site, Job.title, Job.company, Job.location, Job.date_posted,
+    Job.job_url, Job.is_remote, Job.job_type, Job.interval, Job.min_amount, Job.max_amount,
+    Job.currency
+)
+
+# Full-text match against the GIN-indexed search_tsv column, built once and bound per request
+_FTS_CLAUSE = text("search_tsv @@ plainto_tsquery('english', :search_term)")
 
 @retry(
     stop=stop_after_attempt(3),
@@ -20,6 +45,25 @@ def _scrape_jobs_with_retry(**kwargs):
     """Internal function to scrape jobs with retry logic"""
     return scrape_jobs(**kwargs)
 
+# Scrape options that are the same for every request
+_SCRAPE = functools.partial(_scrape_jobs_with_retry, enforce_annual_salary=True, description_format="html")
+
+def _scrape_cache_key(**params) -> str:
+    """Build a stable Redis key from the normalized scrape parameters"""
+    digest = hashlib.blake2b(json.dumps(params, sort_keys=True).encode()).hexdigest()
+    return f"jobs:{digest}"
+
+def _normalize_scraped_dates(jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Make date_posted a datetime whether it came from jobspy (date) or the scrape cache (ISO string)"""
+    for job in jobs:
+        value = job.get('date_posted')
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if isinstance(value, date) and not isinstance(value, datetime):
+            value = datetime.combine(value, time.min)
+        job['date_posted'] = value
+    return jobs
+
 class JobController:
     """Controller for job-related business logic"""
 
@@ -35,34 +79,35 @@ class JobController:
         country: str,
         job_type: str,
         hours_old: int,
-        offset: int
+        cursor: Optional[str]
     ) -> Dict[str, Any]:
         """
         Search for jobs, combining database results with scraped results as needed
         """
 
         # Get jobs from database first
-        db_jobs_dict = await JobController._get_jobs_from_database(
+        db_jobs_dict, next_cursor = await JobController._get_jobs_from_database(
             session, search_term, location, is_remote, job_type,
-            hours_old, offset, results_wanted
+            hours_old, cursor, results_wanted
         )
 
         # Debug logging
-        print(f"🔍 DEBUG: results_wanted = {results_wanted}")
-        print(f"🔍 DEBUG: db_jobs_dict length = {len(db_jobs_dict)}")
+        logger.debug("results_wanted = %s", results_wanted)
+        logger.debug("db_jobs_dict length = %s", len(db_jobs_dict))
 
         # 🚨 DEBUGGING MODE: BYPASSING SCRAPER - ONLY RETURNING DATABASE RESULTS
-        print(f"🚨 DEBUG MODE: Bypassing scraper, only returning database results")
-        print(f"🔍 DEBUG: Found {len(db_jobs_dict)} jobs from database")
-        print(f"🔍 DEBUG: results_wanted = {results_wanted}")
+        logger.debug("Bypassing scraper, only returning database results")
+        logger.debug("Found %s jobs from database", len(db_jobs_dict))
+        logger.debug("results_wanted = %s", results_wanted)
 
         # Return all database results (up to results_wanted)
         final_jobs = db_jobs_dict[:results_wanted] if len(db_jobs_dict) > results_wanted else db_jobs_dict
 
-        print(f"🔍 DEBUG: Returning {len(final_jobs)} jobs from database only")
+        logger.debug("Returning %s jobs from database only", len(final_jobs))
 
         return {
             "jobs": final_jobs,
+            "next_cursor": next_cursor,
             "source": {
                 "database": len(final_jobs),
                 "scraped": 0,
@@ -74,7 +119,7 @@ class JobController:
         # COMMENTED OUT FOR DEBUGGING - ORIGINAL SCRAPER LOGIC:
         # # Check if we have enough results from the database
         # if len(db_jobs_dict) >= results_wanted:
-        #     print(f"🔍 DEBUG: Returning {len(db_jobs_dict)} jobs from database (sufficient)")
+        #     logger.debug("Returning %s jobs from database (sufficient)", len(db_jobs_dict))
         #     return {
         #         "jobs": db_jobs_dict
         #     }
@@ -85,16 +130,16 @@ class JobController:
         # try:
         #     scraped_jobs_dict = await JobController._scrape_additional_jobs(
         #         session, db_jobs_dict, additional_needed, site_name, search_term,
-        #         location, interval, job_type, hours_old, country, is_remote, offset
+        #         location, interval, job_type, hours_old, country, is_remote
         #     )
 
         #     # Combine results
         #     combined_jobs = db_jobs_dict + scraped_jobs_dict
         #     final_jobs = combined_jobs[:results_wanted]
 
-        #     print(f"🔍 DEBUG: combined_jobs length = {len(combined_jobs)}")
-        #     print(f"🔍 DEBUG: final_jobs length = {len(final_jobs)}")
-        #     print(f"🔍 DEBUG: results_wanted = {results_wanted}")
+        #     logger.debug("combined_jobs length = %s", len(combined_jobs))
+        #     logger.debug("final_jobs length = %s", len(final_jobs))
+        #     logger.debug("results_wanted = %s", results_wanted)
 
         #     return {
         #         "jobs": final_jobs,
@@ -123,83 +168,85 @@ class JobController:
         is_remote: bool,
         job_type: str,
         hours_old: int,
-        offset: int,
+        cursor: Optional[str],
         results_wanted: int
-    ) -> List[Dict[str, Any]]:
-        """Query jobs from database with filters"""
-
-        print(f"🔍 DEBUG DB QUERY: Starting database query with parameters:")
-        print(f"🔍 DEBUG DB QUERY: search_term='{search_term}', location='{location}', is_remote={is_remote}")
-        print(f"🔍 DEBUG DB QUERY: job_type='{job_type}', hours_old={hours_old}, offset={offset}, results_wanted={results_wanted}")
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Query a page of jobs from database with filters, newest first, plus the cursor for the next page"""
 
-        # First, let's check how many total jobs are in the database
-        total_count_query = select(Job)
-        total_result = await session.execute(total_count_query)
-        total_jobs = total_result.scalars().all()
-        print(f"🔍 DEBUG DB QUERY: Total jobs in database: {len(total_jobs)}")
+        logger.debug("Starting database query with parameters:")
+        logger.debug("search_term='%s', location='%s', is_remote=%s", search_term, location, is_remote)
+        logger.debug("job_type='%s', hours_old=%s, cursor=%s, results_wanted=%s", job_type, hours_old, cursor, results_wanted)
 
-        # Show a few sample jobs for debugging
-        if total_jobs:
-            print(f"🔍 DEBUG DB QUERY: Sample jobs in database:")
-            for i, job in enumerate(total_jobs[:5]):  # Show first 5 jobs
-                print(f"🔍 DEBUG DB QUERY: Sample {i+1}: title='{job.title}', company='{job.company}', location='{job.location}', job_id='{job.job_id}'")
+        # Only count the table when the count will actually be logged; never load every row just to log it
+        if logger.isEnabledFor(logging.DEBUG):
+            total_jobs = await session.scalar(select(func.count()).select_from(Job))
+            logger.debug("Total jobs in database: %s", total_jobs)
 
         # Create query to find jobs matching the parameters
-        db_jobs_query = select(Job)
+        db_jobs_query = select(*_LISTING_COLUMNS)
 
         # Filter by search term using PostgreSQL full-text search
         if search_term:
-            print(f"🔍 DEBUG DB QUERY: Adding full-text search filter for '{search_term}'")
-            
-            # Create a full-text search query using PostgreSQL's to_tsvector and plainto_tsquery
-            # This searches across title, company, and description fields
-            # plainto_tsquery handles complex terms like "javascript OR typescript OR react"
+            logger.debug("Adding full-text search filter for '%s'", search_term)
             
-            full_text_condition = text("""
-                (to_tsvector('english', COALESCE(title, '')) @@ plainto_tsquery('english', :search_term)) OR
-                (to_tsvector('english', COALESCE(company, '')) @@ plainto_tsquery('english', :search_term)) OR
-                (to_tsvector('english', COALESCE(description, '')) @@ plainto_tsquery('english', :search_term))
-            """).bindparams(search_term=search_term)
-            
-            db_jobs_query = db_jobs_query.where(full_text_condition)
+            db_jobs_query = db_jobs_query.where(_FTS_CLAUSE.bindparams(search_term=search_term))
 
         # Filter by location
         if location:
-            print(f"🔍 DEBUG DB QUERY: Adding location filter for '{location}'")
-            db_jobs_query = db_jobs_query.where(Job.location.ilike(f"%{location}%"))
+            logger.debug("Adding location filter for '%s'", location)
+            db_jobs_query = db_jobs_query.where(
+                func.lower(Job.location).like(f"%{location.lower()}%")
+            )
 
         # Filter by remote status
         if is_remote is not None:
-            print(f"🔍 DEBUG DB QUERY: Adding is_remote filter for {is_remote}")
+            logger.debug("Adding is_remote filter for %s", is_remote)
             db_jobs_query = db_jobs_query.where(Job.is_remote == is_remote)
 
         # Filter by job type
         if job_type:
-            print(f"🔍 DEBUG DB QUERY: Adding job_type filter for '{job_type}'")
-            db_jobs_query = db_jobs_query.where(Job.job_type.ilike(f"%{job_type}%"))
+            logger.debug("Adding job_type filter for '%s'", job_type)
+            db_jobs_query = db_jobs_query.where(
+                func.lower(Job.job_type).like(f"%{job_type.lower()}%")
+            )
 
         # Filter by hours_old (jobs posted within the specified hours)
         if hours_old > 0:
             cutoff_date = datetime.utcnow() - timedelta(hours=hours_old)
-            print(f"🔍 DEBUG DB QUERY: Adding hours_old filter - cutoff_date: {cutoff_date}")
+            logger.debug("Adding hours_old filter - cutoff_date: %s", cutoff_date)
             db_jobs_query = db_jobs_query.where(Job.date_posted >= cutoff_date)
 
-        # Apply offset and limit
-        print(f"🔍 DEBUG DB QUERY: Applying offset={offset} and limit={results_wanted}")
-        db_jobs_query = db_jobs_query.offset(offset).limit(results_wanted)
+        # Resume after the cursor row
+        if cursor:
+            cursor_ts, cursor_id = decode_cursor(cursor)
+            logger.debug("Applying cursor ts=%s, id=%s", cursor_ts, cursor_id)
+            db_jobs_query = db_jobs_query.where(after_cursor(cursor_ts, cursor_id))
 
-        # Debug: Show the compiled SQL query
-        try:
-            compiled_query = str(db_jobs_query.compile(compile_kwargs={"literal_binds": True}))
-            print(f"🔍 DEBUG DB QUERY: SQL Query: {compiled_query}")
-        except Exception as e:
-            print(f"🔍 DEBUG DB QUERY: Could not compile query for debugging: {e}")
+        # Fetch one extra row to know whether another page exists
+        logger.debug("Applying limit=%s", results_wanted)
+        db_jobs_query = db_jobs_query.order_by(
+            Job.date_posted.desc(), Job.id.desc()
+        ).limit(results_wanted + 1)
+
+        # Debug: Show the compiled SQL query (compiling with literal binds is costly, so only when enabled)
+        if logger.isEnabledFor(logging.DEBUG):
+            try:
+                compiled_query = str(db_jobs_query.compile(compile_kwargs={"literal_binds": True}))
+                logger.debug("SQL Query: %s", compiled_query)
+            except Exception as e:
+                logger.debug("Could not compile query for debugging: %s", e)
 
         # Execute the query
-        print(f"🔍 DEBUG DB QUERY: Executing database query...")
+        logger.debug("Executing database query...")
         result = await session.execute(db_jobs_query)
-        db_jobs = result.scalars().all()
-        return [job.dict() for job in db_jobs] if db_jobs else []
+        db_jobs = [dict(row) for row in result.mappings()]
+
+        next_cursor = None
+        if db_jobs and len(db_jobs) > results_wanted:
+            db_jobs = db_jobs[:results_wanted]
+            next_cursor = encode_cursor(db_jobs[-1]['date_posted'], db_jobs[-1]['id'])
+
+        return db_jobs, next_cursor
 
     @staticmethod
     async def _scrape_additional_jobs(
@@ -214,209 +261,121 @@ class JobController:
         hours_old: int,
         country: str,
         is_remote: bool,
-        offset: int
+        offset: int = 0
     ) -> List[Dict[str, Any]]:
         """Scrape additional jobs when database doesn't have enough results"""
 
-        # Console log when scraping is needed
-        print("=" * 60)
-        print("🔍 SCRAPING NEEDED!")
-        print(f"📊 Database results: {len(db_jobs_dict)}")
-        print(f"🎯 Results wanted: {len(db_jobs_dict) + additional_needed}")
-        print(f"⚡ Additional needed: {additional_needed}")
-        print(f"🔎 Search term: {search_term}")
-        print(f"📍 Location: {location}")
-        print("=" * 60)
+        logger.info(
+            "Scraping needed: database results=%s, results wanted=%s, additional needed=%s, "
+            "search term='%s', location='%s'",
+            len(db_jobs_dict), len(db_jobs_dict) + additional_needed, additional_needed,
+            search_term, location
+        )
 
         # Calculate scraper offset: if we have db results, start from where they left off
         scraper_offset = offset + len(db_jobs_dict) if db_jobs_dict else offset
 
-        jobs = _scrape_jobs_with_retry(
-            site_name=site_name,
-            search_term=search_term,
-            location=location,
-            results_wanted=additional_needed,  # Request exactly what we need
-            interval=interval,
-            job_type=job_type,
-            hours_old=hours_old,
-            country_indeed=country,
-            is_remote=is_remote,
-            offset=scraper_offset,
-            enforce_annual_salary=True,
-            description_format="html"
+        # Identical searches within the cache TTL reuse the previous scrape. The scraper offset is left
+        # out of the key since it shifts with how many rows the database already matched.
+        cache_key = _scrape_cache_key(
+            site_name=sorted(site_name), search_term=search_term.strip().lower(),
+            location=location.strip().lower(), interval=interval, job_type=job_type,
+            hours_old=hours_old, country=country, is_remote=is_remote,
+            results_wanted=additional_needed
         )
-
-        scraped_jobs_dict = []
-
-        # Process scraped results
-        if not jobs.empty:
-            scraped_jobs_dict = jobs.to_dict('records')
-            print(f"🔍 DEBUG: Raw scraped jobs count: {len(scraped_jobs_dict)}")
-
-            # Replace NaN values with None for JSON serialization
-            for job in scraped_jobs_dict:
-                for key, value in job.items():
-                    if isinstance(value, float) and math.isnan(value):
-                        job[key] = None
-
-            # Filter out duplicates based on job_id (scraper ID)
-            scraped_jobs_dict = await JobController._filter_duplicate_jobs(
-                session, scraped_jobs_dict, additional_needed
+        scraped_jobs_dict = None
+        if redis_client is not None:
+            try:
+                cached = await redis_client.get(cache_key)
+                if cached is not None:
+                    logger.debug("Scrape cache hit for %s", cache_key)
+                    scraped_jobs_dict = _normalize_scraped_dates(orjson.loads(cached))
+            except RedisError as e:
+                logger.warning("Scrape cache lookup failed: %s", e)
+
+        # On a cache hit the jobs were already saved by the scrape that populated the cache
+        if scraped_jobs_dict is None:
+            # jobspy does blocking HTTP; run it in a worker thread so the event loop keeps serving requests
+            jobs = await asyncio.to_thread(
+                _SCRAPE,
+                site_name=site_name,
+                search_term=search_term,
+                location=location,
+                results_wanted=additional_needed,  # Request exactly what we need
+                interval=interval,
+                job_type=job_type,
+                hours_old=hours_old,
+                country_indeed=country,
+                is_remote=is_remote,
+                offset=scraper_offset
             )
-            print(f"🔍 DEBUG: Filtered scraped jobs count: {len(scraped_jobs_dict)}")
-
-            # Log scraping success
-            print("✅ SCRAPING COMPLETED!")
-            print(f"🎉 Found {len(scraped_jobs_dict)} new unique jobs")
-            print("=" * 60)
-
-            # Insert new scraped jobs into the database
-            print(f"🔍 DEBUG: About to save {len(scraped_jobs_dict)} scraped jobs to database")
-            await JobController._save_jobs_to_database(session, scraped_jobs_dict)
-        else:
-            print("🔍 DEBUG: No jobs returned from scraper (jobs.empty)")
-
-        return scraped_jobs_dict
 
-    @staticmethod
-    async def _filter_duplicate_jobs(
-        session: AsyncSession,
-        scraped_jobs: List[Dict[str, Any]],
-        additional_needed: int
-    ) -> List[Dict[str, Any]]:
-        """Filter out duplicate jobs based on job_id (scraper ID) by checking against entire database"""
-
-        if not scraped_jobs:
-            return []
-
-        # Get all job_ids from scraped jobs
-        scraper_job_ids = [job.get('id') for job in scraped_jobs if job.get('id')]
-
-        if not scraper_job_ids:
-            print("🔍 DEBUG: No job IDs found in scraped jobs")
-            return scraped_jobs[:additional_needed]
-
-        print(f"🔍 DEBUG: Checking {len(scraper_job_ids)} scraped job IDs against database")
+            scraped_jobs_dict = []
+            if not jobs.empty:
+                # Replace NaN values with None for JSON serialization in one vectorized pass
+                jobs = jobs.astype(object).where(jobs.notna(), None)
+                scraped_jobs_dict = _normalize_scraped_dates(jobs.to_dict('records'))
+                logger.debug("Raw scraped jobs count: %s", len(scraped_jobs_dict))
 
-        # Query database to find existing job_ids
-        existing_job_ids_query = select(Job.job_id).where(Job.job_id.in_(scraper_job_ids))
-        result = await session.execute(existing_job_ids_query)
-        existing_job_ids = set(result.scalars().all())
+                # Drop jobs without a scraper ID and duplicates within this batch;
+                # duplicates of rows already in the database are skipped by the insert
+                scraped_jobs_dict = list({job['id']: job for job in scraped_jobs_dict if job.get('id')}.values())
+                logger.debug("Deduplicated scraped jobs count: %s", len(scraped_jobs_dict))
 
-        print(f"🔍 DEBUG: Found {len(existing_job_ids)} existing job_ids in database: {existing_job_ids}")
-
-        filtered_jobs = []
-        processed_ids = set()  # Track IDs we've already processed in this batch
-
-        for job in scraped_jobs:
-            scraper_job_id = job.get('id')  # Get ID from scraper
-
-            # Skip if no job ID
-            if not scraper_job_id:
-                print(f"🔍 DEBUG: Skipping job without ID: {job.get('title', 'Unknown title')}")
-                continue
-
-            # Skip if duplicate in database
-            if scraper_job_id in existing_job_ids:
-                print(f"🔍 DEBUG: Skipping duplicate job_id '{scraper_job_id}' (exists in database)")
-                continue
-
-            # Skip if duplicate in current batch
-            if scraper_job_id in processed_ids:
-                print(f"🔍 DEBUG: Skipping duplicate job_id '{scraper_job_id}' (duplicate in current batch)")
-                continue
+                logger.debug("About to save %s scraped jobs to database", len(scraped_jobs_dict))
+                await JobController._save_jobs_to_database(session, scraped_jobs_dict)
+            else:
+                logger.debug("No jobs returned from scraper (jobs.empty)")
 
-            filtered_jobs.append(job)
-            processed_ids.add(scraper_job_id)
+            if redis_client is not None:
+                try:
+                    await redis_client.set(
+                        cache_key, orjson.dumps(scraped_jobs_dict, default=str), ex=settings.scrape_cache_ttl
+                    )
+                except RedisError as e:
+                    logger.warning("Scrape cache store failed: %s", e)
 
-            print(f"🔍 DEBUG: Added job_id '{scraper_job_id}' to filtered jobs")
+        # Skip jobs the database page already returned
+        db_job_ids = {job['job_id'] for job in db_jobs_dict}
+        scraped_jobs_dict = [job for job in scraped_jobs_dict if job['id'] not in db_job_ids][:additional_needed]
 
-            # Stop when we have enough additional results
-            if len(filtered_jobs) >= additional_needed:
-                break
+        logger.info("Scraping completed: found %s jobs not already on this page", len(scraped_jobs_dict))
 
-        print(f"🔍 DEBUG: Filtered {len(scraped_jobs)} scraped jobs down to {len(filtered_jobs)} unique jobs")
-        return filtered_jobs
+        return scraped_jobs_dict
 
     @staticmethod
-    async def _save_jobs_to_database(session: AsyncSession, jobs_dict: List[Dict[str, Any]]) -> None:
-        """Save scraped jobs to database"""
+    async def _save_jobs_to_database(session: AsyncSession, jobs_dict: List[Dict[str, Any]]) -> Set[str]:
+        """Save scraped jobs to database in one statement, returning the job_ids that were actually inserted"""
 
         if not jobs_dict:
-            print("🔍 DEBUG: No jobs to save (jobs_dict is empty)")
-            return
-
-        print(f"🔍 DEBUG: Attempting to save {len(jobs_dict)} jobs to database")
+            logger.debug("No jobs to save (jobs_dict is empty)")
+            return set()
+
+        logger.debug("Attempting to save %s jobs to database", len(jobs_dict))
+
+        # Map scraper's 'id' to 'job_id' and keep only columns the job table has.
+        # Rows are plain dicts for a Core executemany; no Job instances are built.
+        columns = [c for c in Job.__table__.columns.keys() if c not in ('id', 'search_tsv')]
+        rows = []
+        for job_data in jobs_dict:
+            row = {c: job_data.get(c) for c in columns}
+            row['job_id'] = job_data.get('id')
+            rows.append(row)
+
+        job_table = Job.__table__
+        stmt = (
+            pg_insert(job_table)
+            .on_conflict_do_nothing(index_elements=['job_id'])
+            .returning(job_table.c.job_id)
+        )
 
         try:
-            new_db_jobs = []
-            for i, job_data in enumerate(jobs_dict):
-                try:
-                    # Map scraper's 'id' to 'job_id' and exclude the original 'id'
-                    job_dict = {k: v for k, v in job_data.items() if k != 'id'}
-                    if 'id' in job_data:
-                        job_dict['job_id'] = job_data['id']
-                        print(f"🔍 DEBUG: Job {i+1}: Mapping scraper ID '{job_data['id']}' to job_id")
-                    else:
-                        print(f"🔍 DEBUG: Job {i+1}: No 'id' field found in job_data")
-
-                    # Print a few key fields to debug
-                    print(f"🔍 DEBUG: Job {i+1}: title='{job_dict.get('title', 'N/A')}', company='{job_dict.get('company', 'N/A')}'")
-
-                    new_job = Job(**job_dict)
-                    new_db_jobs.append(new_job)
-                    print(f"🔍 DEBUG: Job {i+1}: Successfully created Job object")
-                except Exception as job_error:
-                    print(f"❌ ERROR: Failed to create Job object for job {i+1}: {job_error}")
-                    print(f"❌ ERROR: Job data keys: {list(job_data.keys())}")
-                    continue
-
-            print(f"🔍 DEBUG: Created {len(new_db_jobs)} Job objects")
-
-            if new_db_jobs:
-                session.add_all(new_db_jobs)
-                print("🔍 DEBUG: Added jobs to session, committing...")
-                await session.commit()
-                print("✅ DEBUG: Successfully committed jobs to database!")
-            else:
-                print("⚠️ DEBUG: No valid jobs to save")
-
+            result = await session.execute(stmt, rows)
+            inserted_ids = set(result.scalars().all())
+            await session.commit()
+            logger.debug("Inserted %s of %s jobs (rest already existed)", len(inserted_ids), len(rows))
+            return inserted_ids
         except Exception as e:
-            print(f"❌ ERROR: Failed to save jobs to database: {e}")
-            print(f"❌ ERROR: Exception type: {type(e)}")
-
-            # Check if it's a unique constraint violation
-            error_message = str(e).lower()
-            if 'unique' in error_message or 'duplicate' in error_message:
-                print("⚠️ DEBUG: Detected unique constraint violation - some jobs may already exist")
-                # Try to save jobs individually to identify which ones are duplicates
-                await session.rollback()
-                await JobController._save_jobs_individually(session, new_db_jobs)
-            else:
-                await session.rollback()
-                print("🔄 DEBUG: Rolled back transaction")
-                raise e
-
-    @staticmethod
-    async def _save_jobs_individually(session: AsyncSession, jobs: List[Job]) -> None:
-        """Save jobs individually to handle unique constraint violations gracefully"""
-
-        saved_count = 0
-        duplicate_count = 0
-
-        for i, job in enumerate(jobs):
-            try:
-                session.add(job)
-                await session.commit()
-                saved_count += 1
-                print(f"✅ DEBUG: Successfully saved job {i+1} individually (job_id: {job.job_id})")
-            except Exception as e:
-                await session.rollback()
-                error_message = str(e).lower()
-                if 'unique' in error_message or 'duplicate' in error_message:
-                    duplicate_count += 1
-                    print(f"⚠️ DEBUG: Skipped duplicate job {i+1} (job_id: {job.job_id})")
-                else:
-                    print(f"❌ ERROR: Failed to save job {i+1} individually: {e}")
-
-        print(f"📊 DEBUG: Individual save results - Saved: {saved_count}, Duplicates: {duplicate_count}, Total: {len(jobs)}")
+            logger.error("Failed to save jobs to database: %s", e)
+            await session.rollback()
+            raise e
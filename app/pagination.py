@@ -0,0 +1,36 @@
+from typing import Optional, Tuple
+from datetime import datetime
+from sqlalchemy import tuple_, and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+import base64
+import json
+from db.schema import Job
+
+class InvalidCursorError(ValueError):
+    """Raised when a client-supplied pagination cursor cannot be decoded"""
+
+def encode_cursor(date_posted: Optional[datetime], job_id: int) -> str:
+    """Encode the (date_posted, id) keyset of the last returned row as an opaque cursor"""
+    payload = {"ts": date_posted.isoformat() if date_posted else None, "id": job_id}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    """Decode a cursor produced by encode_cursor, raising InvalidCursorError if it is malformed"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        ts = datetime.fromisoformat(payload["ts"]) if payload["ts"] else None
+        return ts, int(payload["id"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+def after_cursor(cursor_ts: Optional[datetime], cursor_id: int) -> ColumnElement[bool]:
+    """
+    Condition selecting rows after the cursor row in (date_posted DESC, id DESC) order.
+    Postgres sorts NULL dates first, so a NULL cursor date still has every dated row after it.
+    """
+    if cursor_ts is None:
+        return or_(
+            and_(Job.date_posted.is_(None), Job.id < cursor_id),
+            Job.date_posted.is_not(None)
+        )
+    return tuple_(Job.date_posted, Job.id) < tuple_(cursor_ts, cursor_id)
@@ -1,13 +1,18 @@
-from typing import List
+from typing import List, Optional
 from fastapi import APIRouter, Query, HTTPException, Depends
 from sqlmodel import Session
 import requests
+from cachetools import TTLCache
 from sqlmodel.ext.asyncio.session import AsyncSession
 from db.database import get_session
-from app.controller import JobController, max_results_wanted
+from app.controller import JobController, max_results_wanted, max_page_size
+from app.pagination import InvalidCursorError
 
 router = APIRouter()
 
+# Per-worker L1 cache for identical searches fired in quick succession (Redis caches scrapes as L2)
+_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=30)
+
 @router.get("/")
 def read_root():
     return {"Hello": "World"}
@@ -18,16 +23,24 @@ async def get_jobs(
     site_name: List[str] = Query(default=["indeed", "linkedin"]),
     is_remote: bool = Query(default=False),
     location: str = Query(default=""),
-    results_wanted: int = Query(default=max_results_wanted),
+    results_wanted: int = Query(default=max_results_wanted, ge=1, le=max_page_size),
     interval: str = Query(default="yearly"),
     country: str = Query(default="USA"),
     job_type: str = Query(default=""),
     hours_old: int = Query(default=72),
-    offset: int = Query(default=0),
+    cursor: Optional[str] = Query(default=None, description="Opaque cursor from a previous page's next_cursor"),
     session: AsyncSession = Depends(get_session)
 ):
     """Search and return job listings"""
 
+    cache_key = (
+        search_term, tuple(site_name), is_remote, location, results_wanted,
+        interval, country, job_type, hours_old, cursor
+    )
+    cached = _CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         result = await JobController.search_jobs(
             session=session,
@@ -40,10 +53,14 @@ async def get_jobs(
             country=country,
             job_type=job_type,
             hours_old=hours_old,
-            offset=offset
+            cursor=cursor
         )
+        _CACHE[cache_key] = result
         return result
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     except (requests.exceptions.RetryError, requests.exceptions.RequestException) as e:
         raise HTTPException(
             status_code=503,
@@ -9,6 +9,11 @@ class Settings(BaseSettings):
   postgres_db: str = Field(alias="POSTGRES_DB")
   postgres_host: str = Field(default="localhost",alias="POSTGRES_HOST")
   postgres_port: int = Field(default=5432,alias="POSTGRES_PORT")
+  debug: bool = Field(default=False,alias="DEBUG")
+  log_level: str = Field(default="INFO",alias="LOG_LEVEL")
+  use_pgbouncer: bool = Field(default=False,alias="USE_PGBOUNCER")
+  redis_url: str | None = Field(default=None,alias="REDIS_URL")
+  scrape_cache_ttl: int = Field(default=900,alias="SCRAPE_CACHE_TTL")
   class Config:
     env_file = ".env"
     env_file_encoding = "utf-8"
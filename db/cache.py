@@ -0,0 +1,9 @@
+from redis import asyncio as aioredis
+from config import get_settings
+
+settings = get_settings()
+
+# Shared Redis client; caching is disabled when REDIS_URL is not configured
+redis_client: aioredis.Redis | None = (
+  aioredis.from_url(settings.redis_url) if settings.redis_url else None
+)
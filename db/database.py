@@ -1,26 +1,51 @@
+from uuid import uuid4
 from sqlmodel import SQLModel
 from config import get_settings
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import text
+from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine
 
 settings = get_settings()
 
+# Behind PgBouncer the bouncer owns pooling, so each worker opens connections on demand.
+# Transaction pooling can hand each statement a different server connection, so asyncpg's and
+# SQLAlchemy's prepared-statement caches are disabled and statement names are made unique.
+# Otherwise keep a small per-worker pool that can burst, since every uvicorn worker has its own.
+if settings.use_pgbouncer:
+  pool_options = {
+    "poolclass": NullPool,
+    "connect_args": {
+      "statement_cache_size": 0,
+      "prepared_statement_cache_size": 0,
+      "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__"
+    }
+  }
+else:
+  pool_options = {
+    "pool_size": 5,
+    "max_overflow": 15,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800
+  }
+
 engine: AsyncEngine = create_async_engine(
   settings.database_url,
-  echo=True,
-  pool_size=20,
-  max_overflow=0,
-  future=True
+  echo=settings.debug,
+  future=True,
+  **pool_options
+)
+
+AsyncSessionLocal = async_sessionmaker(
+  engine, class_=AsyncSession, expire_on_commit=False
 )
 
 async def init_db():
   async with engine.begin() as conn:
+    await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    # create_all only creates missing tables; existing ones are upgraded with `alembic upgrade head`
     await conn.run_sync(SQLModel.metadata.create_all)
 
 async def get_session():
-  async_session = sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False
-  )
-  async with async_session() as session:
+  async with AsyncSessionLocal() as session:
     yield session
\ No newline at end of file
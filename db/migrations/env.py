@@ -0,0 +1,47 @@
+import asyncio
+from logging.config import fileConfig
+from alembic import context
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import SQLModel
+from config import get_settings
+from db.schema import Job  # noqa: F401 - registers the job table on SQLModel.metadata
+
+config = context.config
+
+if config.config_file_name is not None:
+  fileConfig(config.config_file_name)
+
+target_metadata = SQLModel.metadata
+
+def run_migrations_offline() -> None:
+  """Emit the migration SQL without connecting to the database"""
+  context.configure(
+    url=get_settings().database_url,
+    target_metadata=target_metadata,
+    literal_binds=True,
+    dialect_opts={"paramstyle": "named"}
+  )
+  with context.begin_transaction():
+    context.run_migrations()
+
+def do_run_migrations(connection: Connection) -> None:
+  context.configure(connection=connection, target_metadata=target_metadata)
+  with context.begin_transaction():
+    context.run_migrations()
+
+async def run_async_migrations() -> None:
+  engine = create_async_engine(get_settings().database_url, poolclass=NullPool)
+  async with engine.connect() as connection:
+    await connection.run_sync(do_run_migrations)
+    await connection.commit()
+  await engine.dispose()
+
+def run_migrations_online() -> None:
+  asyncio.run(run_async_migrations())
+
+if context.is_offline_mode():
+  run_migrations_offline()
+else:
+  run_migrations_online()
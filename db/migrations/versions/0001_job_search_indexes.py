@@ -0,0 +1,49 @@
+"""Add search_tsv column and job listing indexes
+
+Brings job tables created before these were part of the schema up to date;
+every statement is a no-op on tables already created by create_all.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+  # A fresh database has no job table yet; init_db's create_all builds it with all of the below
+  if not op.get_context().as_sql and not sa.inspect(op.get_bind()).has_table("job"):
+    return
+
+  op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+  op.execute("""
+    ALTER TABLE job ADD COLUMN IF NOT EXISTS search_tsv tsvector GENERATED ALWAYS AS (
+      setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+      setweight(to_tsvector('english', coalesce(company, '')), 'B') ||
+      setweight(to_tsvector('english', coalesce(description, '')), 'C')
+    ) STORED
+  """)
+  op.execute("CREATE INDEX IF NOT EXISTS job_search_tsv_idx ON job USING gin (search_tsv)")
+  op.execute("CREATE INDEX IF NOT EXISTS job_datepost_id_idx ON job (date_posted DESC, id DESC)")
+  op.execute("CREATE INDEX IF NOT EXISTS job_filter_idx ON job (is_remote, date_posted DESC, id DESC)")
+  op.execute("CREATE INDEX IF NOT EXISTS job_location_trgm ON job USING gin (lower(location) gin_trgm_ops)")
+  op.execute("CREATE INDEX IF NOT EXISTS job_job_type_trgm ON job USING gin (lower(job_type) gin_trgm_ops)")
+
+
+def downgrade() -> None:
+  op.execute("DROP INDEX IF EXISTS job_job_type_trgm")
+  op.execute("DROP INDEX IF EXISTS job_location_trgm")
+  op.execute("DROP INDEX IF EXISTS job_filter_idx")
+  op.execute("DROP INDEX IF EXISTS job_datepost_id_idx")
+  op.execute("DROP INDEX IF EXISTS job_search_tsv_idx")
+  op.execute("ALTER TABLE job DROP COLUMN IF EXISTS search_tsv")
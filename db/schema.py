@@ -1,7 +1,20 @@
+from typing import Any
 from sqlmodel import Field, SQLModel
+from sqlalchemy import Column, Computed, Index, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from datetime import datetime
 
 class Job(SQLModel, table=True):
+  __table_args__ = (
+    Index("job_search_tsv_idx", "search_tsv", postgresql_using="gin"),
+    Index("job_datepost_id_idx", text("date_posted DESC"), text("id DESC")),
+    # Matches the is_remote equality filter followed by the keyset ORDER BY
+    Index("job_filter_idx", "is_remote", text("date_posted DESC"), text("id DESC")),
+    # Trigram indexes serve the leading-wildcard LIKE filters (requires pg_trgm)
+    Index("job_location_trgm", text("lower(location) gin_trgm_ops"), postgresql_using="gin"),
+    Index("job_job_type_trgm", text("lower(job_type) gin_trgm_ops"), postgresql_using="gin"),
+  )
+
   id: int | None = Field(default=None, primary_key=True)
   job_id: str | None = Field(default=None, unique=True)  # ID from the scraper/job site
   date_posted: datetime | None = None
@@ -35,5 +48,18 @@ class Job(SQLModel, table=True):
   company_reviews_count: int | None = None
   vacancy_count: int | None = None
   work_from_home_type: str | None = None
+  # Weighted full-text document maintained by Postgres (title > company > description)
+  search_tsv: Any = Field(
+    default=None,
+    sa_column=Column(
+      TSVECTOR,
+      Computed(
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(company, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'C')",
+        persisted=True
+      )
+    )
+  )
   # emails: list[str] | None = None
   # skills: list[str] | None = None
@@ -1,6 +1,8 @@
+import logging
 from typing import List
 from fastapi import FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from jobspy import scrape_jobs
 from app.routes import router
 from config import get_settings
@@ -8,7 +10,8 @@ from db.database import init_db
 from db.schema import *
 
 settings = get_settings()
-app = FastAPI()
+logging.basicConfig(level=settings.log_level.upper())
+app = FastAPI(default_response_class=ORJSONResponse)
 
 @app.on_event("startup")
 async def on_startup():
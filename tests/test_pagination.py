@@ -0,0 +1,28 @@
+from datetime import datetime
+import pytest
+from sqlalchemy.dialects import postgresql
+from app.pagination import InvalidCursorError, encode_cursor, decode_cursor, after_cursor
+
+def _sql(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+def test_cursor_round_trip():
+    ts = datetime(2025, 8, 1, 12, 30)
+    assert decode_cursor(encode_cursor(ts, 42)) == (ts, 42)
+
+def test_cursor_round_trip_without_date():
+    assert decode_cursor(encode_cursor(None, 7)) == (None, 7)
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "e30=", "eyJ0cyI6IG51bGx9", "eyJ0cyI6ICJub3BlIiwgImlkIjogMX0="])
+def test_decode_cursor_rejects_malformed(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+def test_after_cursor_compares_keyset():
+    sql = _sql(after_cursor(datetime(2025, 8, 1), 42))
+    assert "(job.date_posted, job.id) < (" in sql
+
+def test_after_cursor_without_date_includes_dated_rows():
+    sql = _sql(after_cursor(None, 42))
+    assert "job.date_posted IS NULL AND job.id <" in sql
+    assert "OR job.date_posted IS NOT NULL" in sql